@@ -1,13 +1,30 @@
+from __future__ import annotations  # Keep `X | None` annotations working on Python < 3.10
+
+import os
 import pygame
 import sys
 import math
 import random
 import logging
+import re
+import argparse
+import socket
+import selectors
+import struct
+from collections import deque
+from pygame._sdl2.video import Window, Renderer, Texture  # GPU-scaled presentation
 import pyperclip  # Import the clipboard library
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
+# Smooth the GPU scale from the render surface to the window (SDL defaults to
+# nearest-neighbour). Must be set before any Texture is created.
+os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "linear")
+# Render at the panel's real resolution instead of being stretched by OS display
+# scaling (Windows; macOS and Wayland use allow_highdpi on the window)
+os.environ.setdefault("SDL_WINDOWS_DPI_AWARENESS", "permonitorv2")
+
 # Initialize Pygame
 pygame.init()
 
@@ -31,6 +48,17 @@ CR_LIST_HEIGHT = (AVAILABLE_UI_HEIGHT - BOX_PADDING) // 2
 ASSIGNMENTS_HEIGHT = (AVAILABLE_UI_HEIGHT - BOX_PADDING) // 2
 ASSIGNMENTS_Y_START = 10 + CR_LIST_HEIGHT + BOX_PADDING  # Position below CR list with padding
 MAX_CR_ENTRIES = 8  # Define max number of CRs to keep
+# Everything above is in logical pixels. The UI is drawn onto an internal surface of
+# WIDTH x HEIGHT times the render scale, which is scaled once to the window size.
+MIN_RENDER_SCALE = 0.5
+MAX_RENDER_SCALE = 2.0
+RENDER_SCALE_STEP = 0.25
+MAX_TEXT_CACHE = 512  # Rendered text surfaces kept between frames
+POINTER_ANGLE = 3 * math.pi / 2  # The pointer sits at the top of the wheel
+MIN_SPIN_SPEED = 0.05  # Initial spin speed range, in radians per frame
+MAX_SPIN_SPEED = 0.2
+SPIN_FRICTION = 0.99  # Speed multiplier applied every frame
+SPIN_STOP_SPEED = 0.01  # The wheel stops once it is slower than this
 
 # TRON-inspired Colors
 TRON_BG = (10, 20, 30)           # Deep blue-black background
@@ -54,6 +82,195 @@ FIREWORK_COLORS = [
     (0, 255, 180), (180, 255, 255)
 ]
 
+# Spectator broadcast protocol: every message is a 3-byte header (opcode, payload
+# length) followed by a compact binary payload. Viewers replay the presenter's
+# events and simulate the spin themselves, so a whole spin is a single message.
+BROADCAST_PORT = 8765
+BROADCAST_HEADER = struct.Struct("!BH")
+SPIN_PAYLOAD = struct.Struct("!dd")       # start angle, spin speed
+STATE_PAYLOAD = struct.Struct("!ddBi")    # angle, speed, spinning, selected name index (-1 = none)
+ASSIGN_PAYLOAD = struct.Struct("!BH")     # CR index, name index
+INDEX_PAYLOAD = struct.Struct("!B")       # CR index (NO_CR_INDEX = none)
+NO_CR_INDEX = 0xFF
+MAX_VIEWER_BACKLOG = 1 << 20  # Drop viewers that fall more than 1 MiB behind
+MSG_RESET = 0
+MSG_ADD_NAME = 1
+MSG_ADD_CR = 2
+MSG_REMOVE_CR = 3
+MSG_SELECT_CR = 4
+MSG_ASSIGN = 5
+MSG_SPIN = 6
+MSG_STATE = 7
+
+def encode_message(opcode: int, payload: bytes = b"") -> bytes:
+    """Frames a broadcast message as header + payload."""
+    return BROADCAST_HEADER.pack(opcode, len(payload)) + payload
+
+def encode_text(text: str) -> bytes:
+    """Encodes a name or CR, truncated to fit the 16-bit payload length."""
+    return text.encode("utf-8")[:0xFFFF]
+
+if hasattr(int, "bit_count"):
+    bit_count = int.bit_count
+else:
+    def bit_count(mask: int) -> int:
+        """Counts the set bits of mask (int.bit_count() needs Python 3.10)."""
+        return bin(mask).count("1")
+
+def slice_at_pointer(angle: float, slice_count: int) -> int:
+    """Returns the index of the slice under the pointer for a wheel at angle."""
+    relative_angle = (POINTER_ANGLE - angle) % (2 * math.pi)
+    slice_angle = 2 * math.pi / slice_count
+    return int(relative_angle / slice_angle) % slice_count
+
+def spin_result_angle(angle: float, speed: float) -> float:
+    """Replays the friction loop in SpinningWheel.update() and returns where the wheel stops."""
+    while True:
+        angle += speed
+        speed *= SPIN_FRICTION
+        angle %= (2 * math.pi)
+        if speed < SPIN_STOP_SPEED:
+            return angle
+
+def plan_spin_speed(start_angle: float, slice_index: int, slice_count: int,
+                    max_speed: float = MAX_SPIN_SPEED) -> float | None:
+    """Finds an initial speed that makes the wheel stop on the given slice.
+
+    A spin lasting n frames covers speed * (1 - f**n) / (1 - f) radians, where f is
+    SPIN_FRICTION, and needs SPIN_STOP_SPEED / f**(n - 1) <= speed < SPIN_STOP_SPEED / f**n.
+    Every frame count and number of extra turns gives at most one exact speed, and
+    one of those is picked at random so spins still look different each time.
+    Very thin slices can fall between the reachable stopping angles; then a
+    faster spin (more turns, shifted gaps) is tried before giving up.
+    """
+    slice_angle = 2 * math.pi / slice_count
+    for _ in range(8):
+        # Aim somewhere inside the slice rather than at its edge
+        target = (POINTER_ANGLE - (slice_index + random.uniform(0.2, 0.8)) * slice_angle) % (2 * math.pi)
+        distance = (target - start_angle) % (2 * math.pi)
+        candidates = []
+        frames = 1
+        while SPIN_STOP_SPEED / SPIN_FRICTION ** (frames - 1) < max_speed:
+            low = max(SPIN_STOP_SPEED / SPIN_FRICTION ** (frames - 1), MIN_SPIN_SPEED)
+            high = min(SPIN_STOP_SPEED / SPIN_FRICTION ** frames, max_speed)
+            travel_per_speed = (1 - SPIN_FRICTION ** frames) / (1 - SPIN_FRICTION)
+            speed = distance / travel_per_speed
+            while speed < high:
+                if speed >= low:
+                    candidates.append(speed)
+                speed += 2 * math.pi / travel_per_speed
+            frames += 1
+        random.shuffle(candidates)
+        for speed in candidates:
+            # Guard against float rounding right at a frame-count boundary
+            if slice_at_pointer(spin_result_angle(start_angle, speed), slice_count) == slice_index:
+                return speed
+    if max_speed < 2 * MAX_SPIN_SPEED:
+        return plan_spin_speed(start_angle, slice_index, slice_count, max_speed * 1.5)
+    return None
+
+class SelectionEngine:
+    """Tracks which wheel slices are eligible for each CR as bitsets.
+
+    Bit i of every mask stands for slice i of the wheel (SpinningWheel.names[i]),
+    so combining vacations, per-CR exclusions and the cooldown window is a few
+    integer operations no matter how many names or rules there are.
+    """
+    def __init__(self, cooldown: int = 0, away: list[str] | None = None):
+        """Sets up the rules; cooldown is how many recent picks sit out a spin."""
+        self.cooldown = cooldown
+        self.away_names: set[str] = set(away or [])
+        self.reset()
+
+    def reset(self) -> None:
+        """Forgets all names, CR rules and picks, keeping the configured rules."""
+        self.slice_count = 0
+        self.name_masks: dict[str, int] = {}  # Name -> bits of all its slices
+        self.away_mask = 0
+        self.cr_excluded_names: dict[str, set[str]] = {}
+        self.cr_masks: dict[str, int] = {}
+        self.recent_picks: deque[str] = deque(maxlen=self.cooldown)
+        self.cooldown_mask = 0
+
+    def add_name(self, name: str) -> None:
+        """Registers the next slice of the wheel."""
+        bit = 1 << self.slice_count
+        self.slice_count += 1
+        self.name_masks[name] = self.name_masks.get(name, 0) | bit
+        if name in self.away_names:
+            self.away_mask |= bit
+        for cr, excluded in self.cr_excluded_names.items():
+            if name in excluded:
+                self.cr_masks[cr] |= bit
+
+    def set_away(self, name: str, away: bool = True) -> None:
+        """Marks a name as (un)available for every CR, e.g. while on vacation."""
+        if away:
+            self.away_names.add(name)
+            self.away_mask |= self.name_masks.get(name, 0)
+        else:
+            self.away_names.discard(name)
+            self.away_mask &= ~self.name_masks.get(name, 0)
+
+    def exclude(self, cr: str, name: str) -> None:
+        """Keeps a name from being picked for one CR, e.g. the CR's author."""
+        self.cr_excluded_names.setdefault(cr, set()).add(name)
+        self.cr_masks[cr] = self.cr_masks.get(cr, 0) | self.name_masks.get(name, 0)
+
+    def forget_cr(self, cr: str) -> None:
+        """Drops the rules of a CR that left the list."""
+        self.cr_excluded_names.pop(cr, None)
+        self.cr_masks.pop(cr, None)
+
+    def record_pick(self, name: str) -> None:
+        """Puts a picked name on cooldown for the next spins."""
+        if self.cooldown <= 0:
+            return
+        self.recent_picks.append(name)
+        self.cooldown_mask = 0
+        for recent in self.recent_picks:
+            self.cooldown_mask |= self.name_masks.get(recent, 0)
+
+    def eligible_mask(self, cr: str | None, use_cooldown: bool = True) -> int:
+        """Returns the bits of all slices that may be picked for cr."""
+        mask = ((1 << self.slice_count) - 1) & ~self.away_mask
+        if cr is not None:
+            mask &= ~self.cr_masks.get(cr, 0)
+        if use_cooldown:
+            mask &= ~self.cooldown_mask
+        return mask
+
+    def pickable_mask(self, cr: str | None) -> int:
+        """Returns the bits of the slices pick() draws from for cr."""
+        # The cooldown is a soft rule: rather relax it than pick nobody
+        return self.eligible_mask(cr) or self.eligible_mask(cr, use_cooldown=False)
+
+    def pick(self, cr: str | None) -> int | None:
+        """Draws one eligible slice uniformly at random, or None if nobody is eligible."""
+        mask = self.pickable_mask(cr)
+        if not mask:
+            return None
+        if not mask & ~self.cooldown_mask:
+            logging.info("Everyone eligible is on cooldown, ignoring cooldown for this spin")
+        return self.nth_set_bit(mask, random.randrange(bit_count(mask)))
+
+    @staticmethod
+    def nth_set_bit(mask: int, n: int) -> int:
+        """Returns the position of the n-th (0-based) set bit of mask."""
+        offset = 0
+        # Skip whole 64-bit words first, then walk the bits of the right word
+        while True:
+            word = mask & 0xFFFFFFFFFFFFFFFF
+            count = bit_count(word)
+            if n < count:
+                break
+            n -= count
+            mask >>= 64
+            offset += 64
+        for _ in range(n):
+            word &= word - 1  # Clear the lowest set bit
+        return offset + (word & -word).bit_length() - 1
+
 class Particle:
     def __init__(self, x: float, y: float, color: tuple):
         """Initializes a particle at (x, y) with the given color."""
@@ -75,12 +292,13 @@ class Particle:
         self.alpha = max(0, self.alpha - self.fade_rate)
         return self.lifetime > 0
         
-    def draw(self, surface) -> None:
+    def draw(self, surface, scale: float = 1.0) -> None:
         if self.alpha > 0:
             color_with_alpha = (self.color[0], self.color[1], self.color[2], int(self.alpha))
-            temp_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surface, color_with_alpha, (self.size, self.size), self.size)
-            surface.blit(temp_surface, (int(self.x - self.size), int(self.y - self.size)))
+            size = max(1, round(self.size * scale))
+            temp_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(temp_surface, color_with_alpha, (size, size), size)
+            surface.blit(temp_surface, (int(self.x * scale - size), int(self.y * scale - size)))
 
 class Firework:
     def __init__(self, x: int, y: int):
@@ -107,40 +325,160 @@ class Firework:
         for _ in range(num_particles):
             self.particles.append(Particle(self.x, self.y, self.explosion_color))
             
-    def draw(self, surface) -> None:
+    def draw(self, surface, scale: float = 1.0) -> None:
         if not self.exploded:
             # Draw the rocket going up
-            pygame.draw.rect(surface, self.explosion_color, (self.x - 1, self.y - 4, 2, 4))
+            pygame.draw.rect(surface, self.explosion_color,
+                             ((self.x - 1) * scale, (self.y - 4) * scale, max(1, 2 * scale), max(1, 4 * scale)))
         else:
             # Draw all explosion particles
             for particle in self.particles:
-                particle.draw(surface)
+                particle.draw(surface, scale)
+
+class BroadcastServer:
+    def __init__(self, host: str, port: int):
+        """Listens for spectator connections on (host, port)."""
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((host, port))
+        self.listener.listen(128)
+        self.listener.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        # Pending outgoing bytes per viewer, flushed without blocking each frame
+        self.viewers: dict[socket.socket, bytearray] = {}
+        logging.info(f"Broadcasting wheel on {host}:{port}")
+
+    def publish(self, message: bytes) -> None:
+        """Queues an encoded message for every connected viewer."""
+        for backlog in self.viewers.values():
+            backlog.extend(message)
+
+    def poll(self, wheel: "SpinningWheel") -> None:
+        """Accepts new viewers, detects hang-ups and flushes queued messages."""
+        while True:
+            try:
+                viewer, address = self.listener.accept()
+            except BlockingIOError:
+                break
+            viewer.setblocking(False)
+            viewer.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # New viewers start from a full snapshot, then follow the deltas
+            self.viewers[viewer] = bytearray(wheel.snapshot_messages())
+            self.selector.register(viewer, selectors.EVENT_READ)
+            logging.info(f"Spectator joined from {address[0]}. Viewers: {len(self.viewers)}")
+
+        # Viewers never send anything, so a readable socket means they hung up
+        for key, _ in self.selector.select(timeout=0):
+            try:
+                data = key.fileobj.recv(4096)
+            except BlockingIOError:
+                continue
+            except OSError:
+                data = b""
+            if not data:
+                self.drop(key.fileobj)
+
+        for viewer, backlog in list(self.viewers.items()):
+            if backlog:
+                try:
+                    sent = viewer.send(backlog)
+                except BlockingIOError:
+                    sent = 0
+                except OSError:
+                    self.drop(viewer)
+                    continue
+                del backlog[:sent]
+            if len(backlog) > MAX_VIEWER_BACKLOG:
+                logging.warning("Dropping spectator that fell too far behind")
+                self.drop(viewer)
+
+    def drop(self, viewer: socket.socket) -> None:
+        """Disconnects a single viewer."""
+        if viewer in self.viewers:
+            del self.viewers[viewer]
+            self.selector.unregister(viewer)
+            viewer.close()
+            logging.info(f"Spectator left. Viewers: {len(self.viewers)}")
+
+    def close(self) -> None:
+        """Disconnects all viewers and stops listening."""
+        for viewer in list(self.viewers):
+            self.drop(viewer)
+        self.selector.close()
+        self.listener.close()
+
+class SpectatorClient:
+    def __init__(self, host: str, port: int):
+        """Connects to a presenter's broadcast at (host, port)."""
+        self.sock = socket.create_connection((host, port), timeout=5)
+        self.sock.setblocking(False)
+        self.buffer = bytearray()
+        self.connected = True
+        logging.info(f"Watching broadcast from {host}:{port}")
+
+    def poll(self, wheel: "SpinningWheel") -> None:
+        """Reads any pending messages and applies them to the wheel."""
+        while self.connected:
+            try:
+                chunk = self.sock.recv(65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                chunk = b""
+            if not chunk:
+                # Keep showing the last known state once the presenter is gone
+                logging.info("Broadcast ended")
+                self.connected = False
+                self.sock.close()
+                break
+            self.buffer.extend(chunk)
+
+        header_size = BROADCAST_HEADER.size
+        while len(self.buffer) >= header_size:
+            opcode, length = BROADCAST_HEADER.unpack_from(self.buffer)
+            end = header_size + length
+            if len(self.buffer) < end:
+                break
+            payload = bytes(self.buffer[header_size:end])
+            del self.buffer[:end]
+            wheel.apply_message(opcode, payload)
 
 class SpinningWheel:
-    def __init__(self) -> None:
-        """Initializes the spinning wheel and its properties."""
+    def __init__(self, broadcast_server: BroadcastServer | None = None,
+                 spectator_client: SpectatorClient | None = None,
+                 selection: SelectionEngine | None = None,
+                 render_scale: float = 1.0,
+                 window_size: tuple[int, int] | None = None,
+                 fullscreen: bool = False) -> None:
+        """Initializes the spinning wheel and its properties.
+
+        With a broadcast_server every state change is published to spectators;
+        with a spectator_client the wheel is read-only and mirrors a presenter.
+        The selection engine decides who is eligible for each spin.
+        render_scale sets the resolution of the internal render surface relative
+        to the logical WIDTH x HEIGHT layout; the window can be any size.
+        """
         # Use the globally calculated CENTER for this instance
         self.center = CENTER  # Ensure this uses the updated CENTER_Y
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        # Update the window title
-        pygame.display.set_caption("Wheel of Opportunity")
+        # The window is driven by an SDL renderer, so the final scale to the window
+        # size happens on the GPU
+        title = "Wheel of Opportunity (spectating)" if spectator_client else "Wheel of Opportunity"
+        self.window = Window(title, size=window_size or (WIDTH, HEIGHT), resizable=True,
+                             fullscreen_desktop=fullscreen, allow_highdpi=True)
+        self.renderer = Renderer(self.window)
+        self.renderer.draw_color = (*TRON_BLACK, 255)  # Letterbox bars
+        # On high-DPI displays the window size is in points and the renderer's
+        # output in pixels; view_rect is in pixels
+        self.output_size: tuple[int, int] = (0, 0)  # Output size view_rect was computed for
+        self.pixels_per_point: float = 1.0
+        self.broadcast_server = broadcast_server
+        self.spectator_client = spectator_client
+        self.selection = selection or SelectionEngine()
         self.clock = pygame.time.Clock()
-        # Try finding a blocky system font, or suggest loading a pixel font TTF
-        try:
-            # Attempt to find a monospaced/blocky font
-            font_name = pygame.font.match_font('consolas, courier new, monospace')
-            self.font = pygame.font.Font(font_name, FONT_SIZE)
-        except:
-             # Fallback to default font
-            self.font = pygame.font.Font(None, FONT_SIZE)
-            print("Blocky font not found, using default.")
-        # Create a smaller font for CR and assignments at 75% of the current size
-        if 'font_name' in locals() and font_name:
-            self.small_font = pygame.font.Font(font_name, int(FONT_SIZE * 0.75))
-            self.tiny_font = pygame.font.Font(font_name, int(FONT_SIZE * 0.55))
-        else:
-            self.small_font = pygame.font.Font(None, int(FONT_SIZE * 0.75))
-            self.tiny_font = pygame.font.Font(None, int(FONT_SIZE * 0.55))  # Fixed: added closing parenthesis
+        # The render surface (self.screen), fonts and text cache depend on the scale
+        self.render_scale: float = 0
+        self.set_render_scale(render_scale)
+        self.view_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)  # Where the render surface lands in the window
         
         # Start with an empty list of names
         self.names: list[str] = []
@@ -175,60 +513,288 @@ class SpinningWheel:
 
         # Spin button properties
         self.spin_button_rect = None  # Store spin button rect for click detection
+        self.spin_cr: str | None = None  # The CR the current spin was picked for
 
         # Delete icon properties
         self.cr_delete_icon_rects = {}  # Map CR to its delete icon rect
         
+    def set_render_scale(self, scale: float) -> None:
+        """Sets the render scale, rebuilding the render surface, fonts and cached text."""
+        scale = min(max(scale, MIN_RENDER_SCALE), MAX_RENDER_SCALE)
+        if scale == self.render_scale:
+            return
+        self.render_scale = scale
+        self.screen = pygame.Surface((self.px(WIDTH), self.px(HEIGHT)))
+        self.texture = Texture(self.renderer, self.screen.get_size(), streaming=True)
+        self.load_fonts()
+        self.text_cache: dict[tuple, pygame.Surface] = {}
+        logging.info(f"Render scale: {scale}x ({self.screen.get_width()}x{self.screen.get_height()})")
+
+    def load_fonts(self) -> None:
+        """Loads all fonts at the current render scale."""
+        # Try finding a blocky system font, or suggest loading a pixel font TTF
+        try:
+            # Attempt to find a monospaced/blocky font
+            font_name = pygame.font.match_font('consolas, courier new, monospace')
+            self.font = pygame.font.Font(font_name, self.px(FONT_SIZE))
+        except:
+             # Fallback to default font
+            font_name = None
+            self.font = pygame.font.Font(None, self.px(FONT_SIZE))
+            print("Blocky font not found, using default.")
+        # Create a smaller font for CR and assignments at 75% of the current size
+        self.small_font = pygame.font.Font(font_name, int(FONT_SIZE * 0.75 * self.render_scale))
+        self.tiny_font = pygame.font.Font(font_name, int(FONT_SIZE * 0.55 * self.render_scale))
+
+    def px(self, value: float) -> int:
+        """Converts a logical length or coordinate to render pixels."""
+        return round(value * self.render_scale)
+
+    def render_rect(self, rect) -> pygame.Rect:
+        """Converts a logical rect to render pixels without gaps between neighbours."""
+        rect = pygame.Rect(rect)
+        left, top = self.px(rect.left), self.px(rect.top)
+        return pygame.Rect(left, top, self.px(rect.right) - left, self.px(rect.bottom) - top)
+
+    def render_point(self, point: tuple[float, float]) -> tuple[float, float]:
+        """Converts a logical point to render pixels."""
+        return (point[0] * self.render_scale, point[1] * self.render_scale)
+
+    def draw_rect(self, color: tuple, rect, width: int = 0, border_radius: int = 0) -> None:
+        """Draws a rect given in logical coordinates."""
+        pygame.draw.rect(self.screen, color, self.render_rect(rect),
+                         max(1, self.px(width)) if width else 0,
+                         border_radius=self.px(border_radius))
+
+    def draw_line(self, color: tuple, start: tuple, end: tuple, width: int = 1) -> None:
+        """Draws a line given in logical coordinates."""
+        pygame.draw.line(self.screen, color, self.render_point(start), self.render_point(end), max(1, self.px(width)))
+
+    def draw_polygon(self, color: tuple, points: list, width: int = 0) -> None:
+        """Draws a polygon given in logical coordinates."""
+        pygame.draw.polygon(self.screen, color, [self.render_point(p) for p in points],
+                            max(1, self.px(width)) if width else 0)
+
+    def draw_circle(self, color: tuple, center: tuple, radius: float, width: int = 0) -> None:
+        """Draws a circle given in logical coordinates."""
+        pygame.draw.circle(self.screen, color, self.render_point(center), radius * self.render_scale,
+                           max(1, self.px(width)) if width else 0)
+
+    def render_text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Renders text at the current scale, reusing surfaces from earlier frames."""
+        key = (id(font), text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= MAX_TEXT_CACHE:
+                self.text_cache.clear()
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+        return surface
+
+    def text_size(self, font: pygame.font.Font, text: str) -> tuple[float, float]:
+        """Returns the logical size text would take up in font."""
+        width, height = font.size(text)
+        return (width / self.render_scale, height / self.render_scale)
+
+    def draw_text(self, font: pygame.font.Font, text: str, color: tuple, **position) -> pygame.Rect:
+        """Draws text placed by a logical rect position (e.g. topleft=, center=).
+
+        Returns the logical rect the text occupies.
+        """
+        surface = self.render_text(font, text, color)
+        width, height = self.text_size(font, text)
+        rect = pygame.Rect(0, 0, round(width), round(height))
+        for attribute, value in position.items():
+            setattr(rect, attribute, value)
+        self.screen.blit(surface, (self.px(rect.x), self.px(rect.y)))
+        return rect
+
+    def fit_text(self, font: pygame.font.Font, text: str, available_width: float) -> str:
+        """Truncates text with "..." so it fits into available_width logical pixels."""
+        display_text = text
+        while self.text_size(font, display_text + ("..." if display_text != text else ""))[0] > available_width and len(display_text) > 0:
+            display_text = display_text[:-1]
+        return display_text + ("..." if display_text != text else "")
+
+    def present(self) -> None:
+        """Uploads the render surface and lets the GPU scale it to the window, keeping the aspect ratio."""
+        output_size = self.renderer.get_viewport().size
+        if output_size != self.output_size:
+            self.output_size = output_width, output_height = output_size
+            if self.window.size[0]:
+                self.pixels_per_point = output_width / self.window.size[0]
+            factor = min(output_width / WIDTH, output_height / HEIGHT)
+            self.view_rect = pygame.Rect(0, 0, round(WIDTH * factor), round(HEIGHT * factor))
+            self.view_rect.center = (output_width // 2, output_height // 2)
+        if not self.view_rect.width or not self.view_rect.height:
+            return  # Minimized
+        # Only the render surface is copied on the CPU, so its size (the render
+        # scale) decides the cost; clearing the bars is a GPU operation
+        self.texture.update(self.screen)
+        self.renderer.clear()
+        self.texture.draw(dstrect=self.view_rect)
+        self.renderer.present()
+
+    def window_to_logical(self, pos: tuple[int, int]) -> tuple[float, float]:
+        """Maps a window position in points (e.g. a mouse click) to logical coordinates."""
+        factor = self.view_rect.width / WIDTH
+        x = pos[0] * self.pixels_per_point
+        y = pos[1] * self.pixels_per_point
+        return ((x - self.view_rect.x) / factor, (y - self.view_rect.y) / factor)
+
     def add_name(self, name: str) -> None:
         """Adds a new name if valid."""
         if name.strip():
             self.names.append(name.strip())
+            self.selection.add_name(name.strip())
+            self.publish(MSG_ADD_NAME, encode_text(name.strip()))
             logging.info(f"Added name: {name}")
 
     # Updated method: add a CR, limiting the list size and updating associations
     def add_cr(self, cr: str) -> None:
-        """Add a new CR if valid, keeping only the latest MAX_CR_ENTRIES."""
-        cr_stripped = cr.strip()
+        """Add a new CR if valid, keeping only the latest MAX_CR_ENTRIES.
+
+        Words starting with "@" (e.g. "CR-42 @alice") name the CR's authors, who
+        are never picked to review it. An "@" inside a word (URLs, emails) is
+        part of the CR.
+        """
+        authors = [word[1:] for word in cr.split() if word.startswith("@") and len(word) > 1]
+        cr_stripped = re.sub(r"(^|\s)@\S+", " ", cr).strip()
         if cr_stripped:
             # Remove oldest if list is full and delete its association too
             if len(self.cr_list) >= MAX_CR_ENTRIES:
                 old_cr = self.cr_list.pop(0)  # Remove the first (oldest) item
                 if old_cr in self.cr_associations:
                     del self.cr_associations[old_cr]
+                self.selection.forget_cr(old_cr)
             self.cr_list.append(cr_stripped)
             # Initialize association for new CR
             self.cr_associations[cr_stripped] = None
+            for author in authors:
+                self.selection.exclude(cr_stripped, author)
+            self.publish(MSG_ADD_CR, encode_text(self.cr_entry_text(cr_stripped)))
             logging.info(f"Added CR: {cr_stripped}. List size: {len(self.cr_list)}")
-    
+
+    def remove_cr(self, cr: str) -> None:
+        """Remove a CR and its assignment."""
+        if cr in self.cr_list:
+            self.publish(MSG_REMOVE_CR, INDEX_PAYLOAD.pack(self.cr_list.index(cr)))
+            self.cr_list.remove(cr)
+        if cr in self.cr_associations:
+            del self.cr_associations[cr]
+        if self.cr_selected == cr:
+            self.cr_selected = None
+        self.selection.forget_cr(cr)
+
+    def cr_entry_text(self, cr: str) -> str:
+        """Rebuild the "CR @author" text a CR was entered with."""
+        return " @".join([cr, *sorted(self.selection.cr_excluded_names.get(cr, ()))])
+
+    def next_cr(self) -> str | None:
+        """The CR the next spin will be assigned to."""
+        if self.cr_selected:
+            return self.cr_selected
+        return self.cr_list[0] if self.cr_list else None
+
+    def select_cr(self, cr: str | None) -> None:
+        """Select the CR that the next spin will be assigned to."""
+        self.cr_selected = cr
+        index = self.cr_list.index(cr) if cr in self.cr_list else NO_CR_INDEX
+        self.publish(MSG_SELECT_CR, INDEX_PAYLOAD.pack(index))
+
+    def assign(self, cr: str, name: str) -> None:
+        """Assign a name to a CR."""
+        self.cr_associations[cr] = name
+        if cr in self.cr_list and name in self.names:
+            self.publish(MSG_ASSIGN, ASSIGN_PAYLOAD.pack(self.cr_list.index(cr), self.names.index(name)))
+
+    def publish(self, opcode: int, payload: bytes = b"") -> None:
+        """Send a state change to spectators, if broadcasting."""
+        if self.broadcast_server:
+            self.broadcast_server.publish(encode_message(opcode, payload))
+
+    def snapshot_messages(self) -> bytes:
+        """Encode the full wheel state as a replayable sequence of messages."""
+        messages = [encode_message(MSG_RESET)]
+        messages += [encode_message(MSG_ADD_NAME, encode_text(name)) for name in self.names]
+        messages += [encode_message(MSG_ADD_CR, encode_text(self.cr_entry_text(cr))) for cr in self.cr_list]
+        for cr_index, cr in enumerate(self.cr_list):
+            name = self.cr_associations.get(cr)
+            if name is not None and name in self.names:
+                messages.append(encode_message(MSG_ASSIGN, ASSIGN_PAYLOAD.pack(cr_index, self.names.index(name))))
+        selected_cr = self.cr_list.index(self.cr_selected) if self.cr_selected in self.cr_list else NO_CR_INDEX
+        messages.append(encode_message(MSG_SELECT_CR, INDEX_PAYLOAD.pack(selected_cr)))
+        selected_name = self.names.index(self.selected_name) if self.selected_name in self.names else -1
+        messages.append(encode_message(MSG_STATE, STATE_PAYLOAD.pack(self.angle, self.spin_speed, self.spinning, selected_name)))
+        return b"".join(messages)
+
+    def apply_message(self, opcode: int, payload: bytes) -> None:
+        """Apply one broadcast message received from the presenter."""
+        try:
+            if opcode == MSG_RESET:
+                self.names = []
+                self.cr_list = []
+                self.cr_associations = {}
+                self.cr_selected = None
+                self.selected_name = None
+                self.selection.reset()
+            elif opcode == MSG_ADD_NAME:
+                self.add_name(payload.decode("utf-8", errors="ignore"))
+            elif opcode == MSG_ADD_CR:
+                self.add_cr(payload.decode("utf-8", errors="ignore"))
+            elif opcode == MSG_REMOVE_CR:
+                (cr_index,) = INDEX_PAYLOAD.unpack(payload)
+                if cr_index < len(self.cr_list):
+                    self.remove_cr(self.cr_list[cr_index])
+            elif opcode == MSG_SELECT_CR:
+                (cr_index,) = INDEX_PAYLOAD.unpack(payload)
+                self.cr_selected = self.cr_list[cr_index] if cr_index < len(self.cr_list) else None
+            elif opcode == MSG_ASSIGN:
+                cr_index, name_index = ASSIGN_PAYLOAD.unpack(payload)
+                if cr_index < len(self.cr_list) and name_index < len(self.names):
+                    self.cr_associations[self.cr_list[cr_index]] = self.names[name_index]
+            elif opcode == MSG_SPIN:
+                # Same start angle and speed + same friction = same result as the presenter
+                self.angle, self.spin_speed = SPIN_PAYLOAD.unpack(payload)
+                self.spinning = True
+                self.selected_name = None
+            elif opcode == MSG_STATE:
+                self.angle, self.spin_speed, spinning, name_index = STATE_PAYLOAD.unpack(payload)
+                self.spinning = bool(spinning)
+                self.selected_name = self.names[name_index] if 0 <= name_index < len(self.names) else None
+            else:
+                logging.warning(f"Ignoring unknown broadcast message {opcode}")
+        except struct.error:
+            # Truncated or from a different version; skip it rather than stop watching
+            logging.warning(f"Ignoring malformed broadcast message {opcode} ({len(payload)} bytes)")
+
     def draw_wheel(self) -> None:
         # Use TRON background
         self.screen.fill(TRON_BG)
         
         # Draw active fireworks in the background
         for firework in self.fireworks:
-            firework.draw(self.screen)
+            firework.draw(self.screen, self.render_scale)
         
         # ALWAYS draw the input instructions and box, even if there are no names
         # Input box label - Use TRON_WHITE
-        label = self.font.render("TYPE NAMES HERE:", True, TRON_WHITE)
-        self.screen.blit(label, (10, HEIGHT - 80))
+        self.draw_text(self.font, "TYPE NAMES HERE:", TRON_WHITE, topleft=(10, HEIGHT - 80))
         
         # Input box: neon cyan border, dark bg
         input_box = pygame.Rect(10, HEIGHT - 50, 300, 40)
-        pygame.draw.rect(self.screen, TRON_DARK, input_box)
+        self.draw_rect(TRON_DARK, input_box)
         border_color = TRON_CYAN if self.input_active else TRON_GRAY
-        pygame.draw.rect(self.screen, border_color, input_box, 4)
+        self.draw_rect(border_color, input_box, 4)
         
         # Draw text in input box - TRON_WHITE text
-        text_surface = self.font.render(self.input_text, True, TRON_WHITE)
-        self.screen.blit(text_surface, (input_box.x + 10, input_box.y + 10))
+        text_rect = self.draw_text(self.font, self.input_text, TRON_WHITE, topleft=(input_box.x + 10, input_box.y + 10))
         
         # Draw cursor - Neon cyan
         if self.input_active and self.cursor_visible:
-            cursor_pos = (input_box.x + 10 + text_surface.get_width(), input_box.y + 10)
-            pygame.draw.line(self.screen, TRON_CYAN,
+            cursor_pos = (input_box.x + 10 + text_rect.width, input_box.y + 10)
+            self.draw_line(TRON_CYAN,
                            cursor_pos,
-                           (cursor_pos[0], cursor_pos[1] + text_surface.get_height()),
+                           (cursor_pos[0], cursor_pos[1] + text_rect.height),
                            3)
         
         # Draw "Spin the Wheel" button at the bottom right of the input area, right of the input box
@@ -237,30 +803,29 @@ class SpinningWheel:
         spin_btn_x = 10 + 300 + 20  # 10 (left margin) + 300 (input box width) + 20 (gap)
         spin_btn_y = HEIGHT - 50  # Align with input box (input box y)
         self.spin_button_rect = pygame.Rect(spin_btn_x, spin_btn_y, spin_btn_width, spin_btn_height)
-        pygame.draw.rect(self.screen, TRON_BLUE, self.spin_button_rect, border_radius=8)
-        pygame.draw.rect(self.screen, TRON_CYAN, self.spin_button_rect, 2, border_radius=8)
-        spin_btn_text = self.small_font.render("Spin the Wheel", True, TRON_WHITE)
-        self.screen.blit(
-            spin_btn_text,
-            (self.spin_button_rect.centerx - spin_btn_text.get_width() // 2, self.spin_button_rect.centery - spin_btn_text.get_height() // 2)
-        )
+        self.draw_rect(TRON_BLUE, self.spin_button_rect, border_radius=8)
+        self.draw_rect(TRON_CYAN, self.spin_button_rect, 2, border_radius=8)
+        self.draw_text(self.small_font, "Spin the Wheel", TRON_WHITE, center=self.spin_button_rect.center)
         
         if not self.names:
             # Instructions text - Use TRON_WHITE
-            text1 = self.font.render("Enter names in the box below", True, TRON_WHITE)
-            text2 = self.font.render("Press ENTER after each name", True, TRON_WHITE)
-            text_rect1 = text1.get_rect(center=(self.center[0], self.center[1] - 50))
-            text_rect2 = text2.get_rect(center=(self.center[0], self.center[1]))
-            self.screen.blit(text1, text_rect1)
-            self.screen.blit(text2, text_rect2)
+            self.draw_text(self.font, "Enter names in the box below", TRON_WHITE, center=(self.center[0], self.center[1] - 50))
+            self.draw_text(self.font, "Press ENTER after each name", TRON_WHITE, center=(self.center[0], self.center[1]))
             
             # Draw an empty wheel outline to indicate where the wheel will appear
-            pygame.draw.circle(self.screen, TRON_CYAN, self.center, WHEEL_RADIUS, 2)
+            self.draw_circle(TRON_CYAN, self.center, WHEEL_RADIUS, 2)
             return
         
         # Calculate slice angle in radians
         slice_angle = 2 * math.pi / len(self.names)
         
+        # Slices nobody may pick for the next CR are drawn grayed out. Spectators
+        # don't know the presenter's away list or cooldown, so they show all slices.
+        if self.spectator_client:
+            eligible = -1  # All bits set
+        else:
+            eligible = self.selection.pickable_mask(self.next_cr())
+
         # Draw each slice using TRON colors
         for i, name in enumerate(self.names):
             start_angle = i * slice_angle + self.angle
@@ -275,21 +840,15 @@ class SpinningWheel:
                 points.append((x, y))
             
             # Draw slice with TRON color and neon cyan border
-            pygame.draw.polygon(self.screen, COLORS[i % len(COLORS)], points)
-            pygame.draw.polygon(self.screen, TRON_CYAN, points, 2)
+            slice_color = COLORS[i % len(COLORS)] if eligible >> i & 1 else TRON_GRAY
+            self.draw_polygon(slice_color, points)
+            self.draw_polygon(TRON_CYAN, points, 2)
             
-            # Draw the name - Black, bold text
+            # Draw the name - Black text
             mid_angle = (start_angle + end_angle) / 2
-            # Use bold font for names on the wheel
-            try:
-                bold_font = pygame.font.Font(self.font.get_name(), self.font.get_height())
-                bold_font.set_bold(True)
-            except Exception:
-                bold_font = self.font
-            text = bold_font.render(name, True, TRON_BLACK)
-            text_x = self.center[0] + (WHEEL_RADIUS * 0.7) * math.cos(mid_angle) - text.get_width() / 2
-            text_y = self.center[1] + (WHEEL_RADIUS * 0.7) * math.sin(mid_angle) - text.get_height() / 2
-            self.screen.blit(text, (text_x, text_y))
+            text_x = self.center[0] + (WHEEL_RADIUS * 0.7) * math.cos(mid_angle)
+            text_y = self.center[1] + (WHEEL_RADIUS * 0.7) * math.sin(mid_angle)
+            self.draw_text(self.font, name, TRON_BLACK, center=(text_x, text_y))
         
         # Draw pointer - Neon orange triangle
         pointer_points = [
@@ -297,12 +856,12 @@ class SpinningWheel:
             (self.center[0] - 10, self.center[1] - WHEEL_RADIUS),
             (self.center[0] + 10, self.center[1] - WHEEL_RADIUS)
         ]
-        pygame.draw.polygon(self.screen, TRON_ORANGE, pointer_points)
-        pygame.draw.circle(self.screen, TRON_BG, (self.center[0], self.center[1] - WHEEL_RADIUS), 5)
+        self.draw_polygon(TRON_ORANGE, pointer_points)
+        self.draw_circle(TRON_BG, (self.center[0], self.center[1] - WHEEL_RADIUS), 5)
         
         # Draw a line from center to selection - Neon orange
         if not self.spinning and self.selected_name:
-            pygame.draw.line(self.screen, TRON_ORANGE, self.center, (self.center[0], self.center[1] - WHEEL_RADIUS), 2)
+            self.draw_line(TRON_ORANGE, self.center, (self.center[0], self.center[1] - WHEEL_RADIUS), 2)
         
         # Draw instructions - Neon white, highlight selected name with neon red bg
         instructions_prefix = [
@@ -312,25 +871,21 @@ class SpinningWheel:
         y_offset = 10
         prefix_x = 10
         for i, prefix_str in enumerate(instructions_prefix):
-            # Render and draw the prefix text
-            prefix_text_surface = self.font.render(prefix_str, True, TRON_WHITE)
-            self.screen.blit(prefix_text_surface, (prefix_x, y_offset))
-            current_x = prefix_x + prefix_text_surface.get_width()  # Keep track of horizontal position
+            # Draw the prefix text
+            prefix_rect = self.draw_text(self.font, prefix_str, TRON_WHITE, topleft=(prefix_x, y_offset))
+            current_x = prefix_rect.right  # Keep track of horizontal position
 
             # Special handling for the "Selected:" line
             if i == 1 and self.selected_name:
-                # Render name in neon white
-                name_text_surface = self.font.render(self.selected_name, True, TRON_WHITE)
-                name_rect = name_text_surface.get_rect(topleft=(current_x, y_offset))
-
                 # Draw neon red background rectangle behind the name
-                pygame.draw.rect(self.screen, TRON_RED, name_rect)
+                name_width, name_height = self.text_size(self.font, self.selected_name)
+                self.draw_rect(TRON_RED, (current_x, y_offset, name_width, name_height))
 
                 # Draw the neon white name text on top of the neon red background
-                self.screen.blit(name_text_surface, name_rect.topleft)
+                self.draw_text(self.font, self.selected_name, TRON_WHITE, topleft=(current_x, y_offset))
 
             # Update y_offset for the next line, using the height of the prefix
-            y_offset += prefix_text_surface.get_height() + 5  # Use consistent spacing
+            y_offset += prefix_rect.height + 5  # Use consistent spacing
 
         # After drawing instructions, add CR UI on the right:
         self.draw_cr_input_box()
@@ -339,50 +894,43 @@ class SpinningWheel:
     
     def draw_cr_input_box(self) -> None:
         """Draw the CR input box - TRON Style."""
-        cr_label = self.tiny_font.render("ENTER CR:", True, TRON_WHITE)  # Use tiny font
-        self.screen.blit(cr_label, (CR_UI_X, HEIGHT - 80))
+        self.draw_text(self.tiny_font, "ENTER CR:", TRON_WHITE, topleft=(CR_UI_X, HEIGHT - 80))  # Use tiny font
         cr_box = pygame.Rect(CR_UI_X, HEIGHT - 50, CR_UI_WIDTH, 40)
-        pygame.draw.rect(self.screen, TRON_DARK, cr_box)  # Dark background
+        self.draw_rect(TRON_DARK, cr_box)  # Dark background
         border_color = TRON_CYAN if self.cr_input_active else TRON_GRAY  # Neon cyan border when active
-        pygame.draw.rect(self.screen, border_color, cr_box, 4)  # No border_radius
-        cr_text_surf = self.tiny_font.render(self.cr_input_text, True, TRON_WHITE)  # Neon white text
-        self.screen.blit(cr_text_surf, (cr_box.x + 10, cr_box.y + 10))
+        self.draw_rect(border_color, cr_box, 4)  # No border_radius
+        cr_text_rect = self.draw_text(self.tiny_font, self.cr_input_text, TRON_WHITE, topleft=(cr_box.x + 10, cr_box.y + 10))  # Neon white text
         # Draw cursor if CR input is active
         if self.cr_input_active and self.cursor_visible:
-             cursor_pos = (cr_box.x + 10 + cr_text_surf.get_width(), cr_box.y + 10)
-             pygame.draw.line(self.screen, TRON_CYAN,
+             cursor_pos = (cr_box.x + 10 + cr_text_rect.width, cr_box.y + 10)
+             self.draw_line(TRON_CYAN,
                             cursor_pos,
-                            (cursor_pos[0], cursor_pos[1] + cr_text_surf.get_height()),
+                            (cursor_pos[0], cursor_pos[1] + cr_text_rect.height),
                             3)
     
     def draw_cr_list(self) -> None:
         """Draw the list of CR entries - TRON Style, with delete icon."""
         list_box = pygame.Rect(CR_UI_X, 10, CR_UI_WIDTH, CR_LIST_HEIGHT)
-        pygame.draw.rect(self.screen, TRON_DARK, list_box)
-        pygame.draw.rect(self.screen, TRON_CYAN, list_box, 2)
+        self.draw_rect(TRON_DARK, list_box)
+        self.draw_rect(TRON_CYAN, list_box, 2)
         y_offset = list_box.y + 10
-        title = self.tiny_font.render("CRs:", True, TRON_WHITE)
-        self.screen.blit(title, (list_box.x + 10, y_offset))
-        y_offset += title.get_height() + 5
+        title_rect = self.draw_text(self.tiny_font, "CRs:", TRON_WHITE, topleft=(list_box.x + 10, y_offset))
+        y_offset += title_rect.height + 5
 
         self.cr_delete_icon_rects = {}  # Reset mapping each frame
 
         for cr in self.cr_list:
             available_width = list_box.width - 20 - 28  # Reserve space for delete icon (24px + gap)
-            cr_display_text = cr
-            cr_text_surface = self.tiny_font.render(cr_display_text, True, TRON_WHITE)
-            while cr_text_surface.get_width() > available_width and len(cr_display_text) > 0:
-                cr_display_text = cr_display_text[:-1]
-                cr_text_surface = self.tiny_font.render(cr_display_text + "...", True, TRON_WHITE)
+            cr_display_text = self.fit_text(self.tiny_font, cr, available_width)
+            text_height = round(self.text_size(self.tiny_font, cr_display_text)[1])
 
-            entry_rect = pygame.Rect(list_box.x + 10, y_offset, list_box.width - 20, cr_text_surface.get_height())
+            entry_rect = pygame.Rect(list_box.x + 10, y_offset, list_box.width - 20, text_height)
             text_color = TRON_WHITE
             if self.cr_selected == cr:
-                pygame.draw.rect(self.screen, TRON_ORANGE, entry_rect)
+                self.draw_rect(TRON_ORANGE, entry_rect)
                 text_color = TRON_BLACK
 
-            final_text_surface = self.tiny_font.render(cr_display_text + ("..." if cr_display_text != cr else ""), True, text_color)
-            self.screen.blit(final_text_surface, (entry_rect.x, entry_rect.y))
+            self.draw_text(self.tiny_font, cr_display_text, text_color, topleft=entry_rect.topleft)
 
             # Draw delete icon (simple X) at right side of entry_rect
             icon_size = 18
@@ -392,26 +940,25 @@ class SpinningWheel:
             icon_rect = pygame.Rect(icon_x, icon_y, icon_size, icon_size)
             self.cr_delete_icon_rects[cr] = icon_rect
             # Draw a neon cyan border for the icon
-            pygame.draw.rect(self.screen, TRON_CYAN, icon_rect, border_radius=4)
+            self.draw_rect(TRON_CYAN, icon_rect, border_radius=4)
             # Draw X in the icon
-            pygame.draw.line(self.screen, TRON_RED, (icon_rect.left+4, icon_rect.top+4), (icon_rect.right-4, icon_rect.bottom-4), 2)
-            pygame.draw.line(self.screen, TRON_RED, (icon_rect.left+4, icon_rect.bottom-4), (icon_rect.right-4, icon_rect.top+4), 2)
+            self.draw_line(TRON_RED, (icon_rect.left+4, icon_rect.top+4), (icon_rect.right-4, icon_rect.bottom-4), 2)
+            self.draw_line(TRON_RED, (icon_rect.left+4, icon_rect.bottom-4), (icon_rect.right-4, icon_rect.top+4), 2)
 
-            y_offset += final_text_surface.get_height() + 5
-            if y_offset + final_text_surface.get_height() > list_box.bottom - 10:
+            y_offset += text_height + 5
+            if y_offset + text_height > list_box.bottom - 10:
                 break
     
     def draw_cr_associations(self) -> None:
         """Draw the CR assignments - TRON Style, with Copy button at the bottom inside the box."""
         assoc_box = pygame.Rect(CR_UI_X, ASSIGNMENTS_Y_START, CR_UI_WIDTH, ASSIGNMENTS_HEIGHT)
-        pygame.draw.rect(self.screen, TRON_DARK, assoc_box)
-        pygame.draw.rect(self.screen, TRON_CYAN, assoc_box, 2)
+        self.draw_rect(TRON_DARK, assoc_box)
+        self.draw_rect(TRON_CYAN, assoc_box, 2)
         y_offset = assoc_box.y + 10
 
         # Draw "Assignments:" title
-        title = self.tiny_font.render("Assignments:", True, TRON_WHITE)  # Neon white text
-        self.screen.blit(title, (assoc_box.x + 10, y_offset))
-        y_offset += title.get_height() + 5
+        title_rect = self.draw_text(self.tiny_font, "Assignments:", TRON_WHITE, topleft=(assoc_box.x + 10, y_offset))  # Neon white text
+        y_offset += title_rect.height + 5
 
         # Reserve space for the button at the bottom
         button_height = 48  # Increased height
@@ -427,36 +974,24 @@ class SpinningWheel:
             if name is not None:
                 line = f"{cr}: {name}"
                 available_width = assoc_box.width - 20
-                display_line = line
-                line_text_surface = self.tiny_font.render(display_line, True, TRON_WHITE)  # Neon white text
-                while line_text_surface.get_width() > available_width and len(display_line) > 0:
-                    display_line = display_line[:-1]
-                    line_text_surface = self.tiny_font.render(display_line + "...", True, TRON_WHITE)
-                final_line_text = self.tiny_font.render(display_line + ("..." if display_line != line else ""), True, TRON_WHITE)  # Neon white text
-                if y_offset + final_line_text.get_height() > max_y:
-                    pygame.draw.rect(self.screen, TRON_BG, (assoc_box.x + 5, max_y, assoc_box.width - 10, 10))
-                    more_text = self.tiny_font.render("...", True, TRON_WHITE)  # Neon white text
-                    self.screen.blit(more_text, (assoc_box.centerx - more_text.get_width() // 2, max_y))
+                display_line = self.fit_text(self.tiny_font, line, available_width)
+                line_height = round(self.text_size(self.tiny_font, display_line)[1])
+                if y_offset + line_height > max_y:
+                    self.draw_rect(TRON_BG, (assoc_box.x + 5, max_y, assoc_box.width - 10, 10))
+                    more_width = self.text_size(self.tiny_font, "...")[0]
+                    self.draw_text(self.tiny_font, "...", TRON_WHITE, topleft=(assoc_box.centerx - more_width // 2, max_y))  # Neon white text
                     break
-                self.screen.blit(final_line_text, (assoc_box.x + 10, y_offset))
-                y_offset += final_line_text.get_height() + 2
+                self.draw_text(self.tiny_font, display_line, TRON_WHITE, topleft=(assoc_box.x + 10, y_offset))  # Neon white text
+                y_offset += line_height + 2
 
         # Draw "Copy Assignments" button at the bottom inside the box
-        pygame.draw.rect(self.screen, TRON_BLUE, button_rect, border_radius=8)
-        pygame.draw.rect(self.screen, TRON_CYAN, button_rect, 2, border_radius=8)
-        btn_text = self.tiny_font.render("Copy Assignments", True, TRON_WHITE)  # Neon white text
-        self.screen.blit(
-            btn_text,
-            (button_rect.centerx - btn_text.get_width() // 2, button_rect.centery - btn_text.get_height() // 2)
-        )
+        self.draw_rect(TRON_BLUE, button_rect, border_radius=8)
+        self.draw_rect(TRON_CYAN, button_rect, 2, border_radius=8)
+        self.draw_text(self.tiny_font, "Copy Assignments", TRON_WHITE, center=button_rect.center)  # Neon white text
 
         # Show "Copied!" feedback for 1.2 seconds after copying
         if self.copy_feedback_time and pygame.time.get_ticks() - self.copy_feedback_time < 1200:
-            copied_text = self.tiny_font.render("Copied!", True, TRON_CYAN)  # Neon cyan text
-            self.screen.blit(
-                copied_text,
-                (button_rect.centerx - copied_text.get_width() // 2, button_rect.top - copied_text.get_height() - 2)
-            )
+            self.draw_text(self.tiny_font, "Copied!", TRON_CYAN, midbottom=(button_rect.centerx, button_rect.top - 2))  # Neon cyan text
 
     def copy_assignments_to_clipboard(self):
         """Copy all assignments to clipboard as plain text."""
@@ -492,11 +1027,32 @@ class SpinningWheel:
     
     def spin(self):
         if not self.spinning and self.names:
+            # Pick the winner up front, then spin just hard enough to land on it
+            spin_cr = self.next_cr()
+            target_index = self.selection.pick(spin_cr)
+            if target_index is None:
+                logging.warning("Nobody is eligible for this CR, not spinning")
+                return
+            spin_speed = plan_spin_speed(self.angle, target_index, len(self.names))
+            if spin_speed is None:
+                # A free spin could land on someone the rules exclude
+                logging.warning(f"Could not plan a spin onto {self.names[target_index]}, not spinning")
+                return
             self.spinning = True
-            self.spin_speed = random.uniform(0.05, 0.2)  # In radians
+            self.spin_speed = spin_speed  # In radians
+            # The winner obeys this CR's rules, so it gets the assignment even if
+            # another CR is clicked while the wheel is turning
+            self.spin_cr = spin_cr
             self.selected_name = None
+            self.publish(MSG_SPIN, SPIN_PAYLOAD.pack(self.angle, self.spin_speed))
             
     def update(self):
+        # Exchange state with spectators or the presenter
+        if self.broadcast_server:
+            self.broadcast_server.poll(self)
+        if self.spectator_client:
+            self.spectator_client.poll(self)
+
         # Update cursor blinking - only blink if one of the inputs is active
         if self.input_active or self.cr_input_active:
             current_time = pygame.time.get_ticks()
@@ -512,37 +1068,34 @@ class SpinningWheel:
         # Update wheel spinning
         if self.spinning:
             self.angle += self.spin_speed
-            self.spin_speed *= 0.99  # Apply friction
+            self.spin_speed *= SPIN_FRICTION  # Apply friction
             
             # Keep angle within 0-2π
             self.angle %= (2 * math.pi)
             
-            if self.spin_speed < 0.01:
+            if self.spin_speed < SPIN_STOP_SPEED:
                 self.spinning = False
                 self.spin_speed = 0
                 
                 # Find which slice is at the top (270 degrees or 3π/2)
-                top_angle = 3 * math.pi / 2  # This is our pointer position
-                
-                # Calculate the relative angle
-                relative_angle = (top_angle - self.angle) % (2 * math.pi)
-                slice_angle = 2 * math.pi / len(self.names)
-                selected_index = int(relative_angle / slice_angle) % len(self.names)
+                selected_index = slice_at_pointer(self.angle, len(self.names))
                 self.selected_name = self.names[selected_index]
+                self.selection.record_pick(self.selected_name)
                 
                 print(f"Selected: {self.selected_name}")
                 
                 # Start fireworks celebration when wheel stops
                 self.start_celebration()
 
-                # If no CR is currently selected, auto select the first one if present
-                if not self.cr_selected and self.cr_list:
-                    self.cr_selected = self.cr_list[0]
-                
-                # Assign the selected name to the chosen CR
-                if self.cr_selected:
-                    self.cr_associations[self.cr_selected] = self.selected_name
-                    logging.info(f"Assigned {self.selected_name} to CR {self.cr_selected}")
+                # Assign the selected name to the CR the spin was for, unless it was
+                # deleted mid-spin. Spectators get the assignment from the presenter.
+                spin_cr, self.spin_cr = self.spin_cr, None
+                if spin_cr in self.cr_list and not self.spectator_client:
+                    # If no CR is currently selected, auto select the one spun for
+                    if not self.cr_selected:
+                        self.select_cr(spin_cr)
+                    self.assign(spin_cr, self.selected_name)
+                    logging.info(f"Assigned {self.selected_name} to CR {spin_cr}")
         
     def run(self):
         running = True
@@ -556,6 +1109,16 @@ class SpinningWheel:
                 if event.type == pygame.QUIT:
                     running = False
 
+                # Ctrl+Plus / Ctrl+Minus trade sharpness for frame rate, also for spectators
+                elif event.type == pygame.KEYDOWN and pygame.key.get_mods() & pygame.KMOD_CTRL \
+                        and event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS, pygame.K_MINUS, pygame.K_KP_MINUS):
+                    step = -RENDER_SCALE_STEP if event.key in (pygame.K_MINUS, pygame.K_KP_MINUS) else RENDER_SCALE_STEP
+                    self.set_render_scale(self.render_scale + step)
+
+                elif self.spectator_client:
+                    # Spectators only watch; all state comes from the presenter
+                    continue
+
                 elif event.type == pygame.KEYDOWN:
                     # Get pressed keys and modifier state
                     mods = pygame.key.get_mods()
@@ -600,7 +1163,8 @@ class SpinningWheel:
                         self.cursor_time = pygame.time.get_ticks()
                 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_pos = event.pos
+                    # All layout and hit boxes are in logical coordinates
+                    mouse_pos = self.window_to_logical(event.pos)
                     cr_box = pygame.Rect(CR_UI_X, HEIGHT - 50, CR_UI_WIDTH, 40)
                     name_box = pygame.Rect(10, HEIGHT - 50, 300, 40)
                     cr_list_box = pygame.Rect(CR_UI_X, 10, CR_UI_WIDTH, CR_LIST_HEIGHT)
@@ -619,12 +1183,7 @@ class SpinningWheel:
                     for cr, icon_rect in list(self.cr_delete_icon_rects.items()):
                         if icon_rect.collidepoint(mouse_pos):
                             # Remove CR and its assignment
-                            if cr in self.cr_list:
-                                self.cr_list.remove(cr)
-                            if cr in self.cr_associations:
-                                del self.cr_associations[cr]
-                            if self.cr_selected == cr:
-                                self.cr_selected = None
+                            self.remove_cr(cr)
                             continue  # Don't process further for this click
 
                     # --- Assign user to CR: Click a CR, then click a name on the wheel ---
@@ -632,20 +1191,15 @@ class SpinningWheel:
                     if cr_list_box.collidepoint(mouse_pos):
                         self.input_active = False
                         self.cr_input_active = False
-                        title_height = self.tiny_font.render("CRs:", True, TRON_WHITE).get_height()
+                        title_height = round(self.text_size(self.tiny_font, "CRs:")[1])
                         y_offset = cr_list_box.y + 10 + title_height + 5
                         for cr in self.cr_list:
                             available_width = cr_list_box.width - 20
-                            cr_display_text = cr
-                            temp_text_surface = self.tiny_font.render(cr_display_text, True, TRON_WHITE)
-                            while temp_text_surface.get_width() > available_width and len(cr_display_text) > 0:
-                                cr_display_text = cr_display_text[:-1]
-                                temp_text_surface = self.tiny_font.render(cr_display_text + "...", True, TRON_WHITE)
-                            final_text_surface = self.tiny_font.render(cr_display_text + ("..." if cr_display_text != cr else ""), True, TRON_WHITE)
-                            text_height = final_text_surface.get_height()
+                            cr_display_text = self.fit_text(self.tiny_font, cr, available_width)
+                            text_height = round(self.text_size(self.tiny_font, cr_display_text)[1])
                             entry_rect = pygame.Rect(cr_list_box.x + 10, y_offset, cr_list_box.width - 20, text_height)
                             if entry_rect.collidepoint(mouse_pos):
-                                self.cr_selected = cr
+                                self.select_cr(cr)
                                 self.awaiting_user_assignment = True  # New flag: waiting for user click
                                 break
                             y_offset += text_height + 5
@@ -661,17 +1215,13 @@ class SpinningWheel:
                             mid_angle = (i + 0.5) * slice_angle + self.angle
                             name_x = self.center[0] + (WHEEL_RADIUS * 0.7) * math.cos(mid_angle)
                             name_y = self.center[1] + (WHEEL_RADIUS * 0.7) * math.sin(mid_angle)
-                            # Use bold font for hit detection as well
-                            try:
-                                bold_font = pygame.font.Font(self.font.get_name(), self.font.get_height())
-                                bold_font.set_bold(True)
-                            except Exception:
-                                bold_font = self.font
-                            text_surface = bold_font.render(name, True, TRON_BLACK)
-                            text_rect = text_surface.get_rect(center=(name_x, name_y))
+                            # Use the same font as the wheel for hit detection
+                            text_width, text_height = self.text_size(self.font, name)
+                            text_rect = pygame.Rect(0, 0, round(text_width), round(text_height))
+                            text_rect.center = (name_x, name_y)
                             if text_rect.collidepoint(mouse_pos):
                                 # Assign this user to the selected CR
-                                self.cr_associations[self.cr_selected] = name
+                                self.assign(self.cr_selected, name)
                                 self.awaiting_user_assignment = False
                                 break
 
@@ -696,12 +1246,84 @@ class SpinningWheel:
             self.update()
             self.draw_wheel()
             
-            pygame.display.flip()
+            self.present()
             self.clock.tick(60)
             
+        if self.broadcast_server:
+            self.broadcast_server.close()
         pygame.quit()
         sys.exit()
 
+def non_negative_int(value: str) -> int:
+    """argparse type for counts such as --cooldown."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {number}")
+    return number
+
+def window_size(value: str) -> tuple[int, int]:
+    """argparse type for --window, e.g. "1920x1080"."""
+    parts = value.lower().split("x")
+    try:
+        width, height = (int(part) for part in parts)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {value!r}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"width and height must be positive, got {value!r}")
+    return (width, height)
+
+def port_number(value: str) -> int:
+    """argparse type for TCP ports."""
+    try:
+        port = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a port number, got {value!r}")
+    if not 1 <= port <= 65535:
+        raise argparse.ArgumentTypeError(f"port must be between 1 and 65535, got {port}")
+    return port
+
+def host_and_port(value: str) -> tuple[str, int]:
+    """argparse type for --view, e.g. "presenter-pc" or "10.0.0.5:8765"."""
+    host, _, port = value.rpartition(":") if ":" in value else (value, "", "")
+    if not host:
+        raise argparse.ArgumentTypeError(f"expected HOST[:PORT], got {value!r}")
+    return (host, port_number(port) if port else BROADCAST_PORT)
+
 if __name__ == "__main__":
-    wheel = SpinningWheel()
+    parser = argparse.ArgumentParser(description="Wheel of Opportunity")
+    parser.add_argument("--broadcast", nargs="?", const=BROADCAST_PORT, type=port_number, metavar="PORT",
+                        help=f"publish the wheel to spectators on PORT (default {BROADCAST_PORT})")
+    parser.add_argument("--bind", default="0.0.0.0", help="address to broadcast on (default 0.0.0.0)")
+    parser.add_argument("--view", type=host_and_port, metavar="HOST[:PORT]", help="watch a presenter's broadcast")
+    parser.add_argument("--away", action="append", default=[], metavar="NAME",
+                        help="never pick NAME, e.g. while on vacation (repeatable)")
+    parser.add_argument("--cooldown", type=non_negative_int, default=0, metavar="N",
+                        help="skip names picked in the last N spins (default 0)")
+    parser.add_argument("--render-scale", type=float, default=1.0, metavar="SCALE",
+                        help=f"internal resolution relative to {WIDTH}x{HEIGHT}, "
+                             f"{MIN_RENDER_SCALE}-{MAX_RENDER_SCALE} (default 1.0)")
+    parser.add_argument("--window", type=window_size, metavar="WIDTHxHEIGHT", help=f"window size (default {WIDTH}x{HEIGHT})")
+    parser.add_argument("--fullscreen", action="store_true", help="run fullscreen at the display's resolution")
+    args = parser.parse_args()
+
+    broadcast_server = None
+    if args.broadcast is not None:
+        try:
+            broadcast_server = BroadcastServer(args.bind, args.broadcast)
+        except OSError as e:
+            parser.error(f"cannot broadcast on {args.bind}:{args.broadcast}: {e}")
+    spectator_client = None
+    if args.view:
+        host, port = args.view
+        try:
+            spectator_client = SpectatorClient(host, port)
+        except OSError as e:
+            parser.error(f"cannot connect to {host}:{port}: {e}")
+
+    selection = SelectionEngine(cooldown=args.cooldown, away=args.away)
+    wheel = SpinningWheel(broadcast_server, spectator_client, selection,
+                          render_scale=args.render_scale, window_size=args.window, fullscreen=args.fullscreen)
     wheel.run()